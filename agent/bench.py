@@ -0,0 +1,77 @@
+import argparse
+import asyncio
+import time
+from models.agent import AgentContext, AgentState, AgentConfig
+from agent.state_machine import AgentStateMachine
+from agent.runner import Runner
+
+# Parse a strictly positive integer command-line argument.
+def _positive_int(value: str) -> int:
+    number = int(value)
+    if number <= 0:
+        raise argparse.ArgumentTypeError(f"must be a positive integer, got {value}")
+    return number
+
+# Build a state machine for one synthetic workflow.
+def _build_machine(config: AgentConfig) -> AgentStateMachine:
+    context = AgentContext(
+        user_input="Build a skill-based gaming app like Triumph for the European market, targeting young men.",
+        state=AgentState.PLANNING,
+        research_plan=None,
+        research_report=None,
+        validation_result=None,
+        human_review=None,
+        final_mrd=None,
+        research_retry_count=0,
+        tool_retry_count=0,
+        events=[],
+    )
+    return AgentStateMachine(context=context, config=config)
+
+# Run N synthetic workflows end to end and report total time and per-phase timings.
+def main():
+    parser = argparse.ArgumentParser(
+        description="Benchmark the agent state machine on synthetic workflows."
+    )
+    parser.add_argument("--workflows", type=_positive_int, default=100)
+    parser.add_argument(
+        "--concurrency",
+        type=_positive_int,
+        default=1,
+        help="workflows run at once; per-phase timings are only isolated at 1",
+    )
+    args = parser.parse_args()
+
+    config = AgentConfig(
+        max_research_retries=3,
+        max_tool_retries=2,
+        default_min_section_confidence=0.6,
+        default_min_overall_confidence=0.65,
+    )
+    machines = [_build_machine(config) for _ in range(args.workflows)]
+
+    start = time.perf_counter_ns()
+    contexts = asyncio.run(Runner(args.concurrency).run(machines))
+    elapsed = time.perf_counter_ns() - start
+
+    totals: dict[str, int] = {}
+    cpu_totals: dict[str, int] = {}
+    for context in contexts:
+        for phase, nanoseconds in context.phase_timings.items():
+            totals[phase] = totals.get(phase, 0) + nanoseconds
+        for phase, nanoseconds in context.phase_cpu_timings.items():
+            cpu_totals[phase] = cpu_totals.get(phase, 0) + nanoseconds
+
+    completed = sum(context.state is AgentState.COMPLETED for context in contexts)
+    print(f"workflows: {args.workflows} ({completed} completed)")
+    print(f"total: {elapsed / 1e6:.2f} ms ({elapsed / args.workflows / 1e3:.1f} us/workflow)")
+
+    for phase, nanoseconds in sorted(totals.items(), key=lambda item: -item[1]):
+        print(
+            f"{phase:<14} {nanoseconds / args.workflows / 1e3:10.1f} us/workflow wall"
+            f" {cpu_totals.get(phase, 0) / args.workflows / 1e3:10.1f} us/workflow cpu"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,13 @@
+import time
+from contextlib import contextmanager
+
+# Add the wall-clock and thread CPU nanoseconds spent inside the block to wall_sink[name] and cpu_sink[name].
+@contextmanager
+def timed(name: str, wall_sink: dict[str, int], cpu_sink: dict[str, int]):
+    wall_start = time.perf_counter_ns()
+    cpu_start = time.thread_time_ns()
+    try:
+        yield
+    finally:
+        cpu_sink[name] = cpu_sink.get(name, 0) + time.thread_time_ns() - cpu_start
+        wall_sink[name] = wall_sink.get(name, 0) + time.perf_counter_ns() - wall_start
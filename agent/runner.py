@@ -0,0 +1,20 @@
+import asyncio
+from models.agent import AgentContext
+from agent.state_machine import AgentStateMachine
+
+# Runner hosting many agent state machines on a single event loop.
+class Runner:
+    # Initialize the runner with the number of machines allowed to run at once.
+    def __init__(self, max_concurrent_agents: int):
+        self.max_concurrent_agents = max_concurrent_agents
+
+    # Drive all machines concurrently and return their final contexts in input order.
+    async def run(self, machines: list[AgentStateMachine]) -> list[AgentContext]:
+        slots = asyncio.Semaphore(self.max_concurrent_agents)
+
+        async def run_machine(machine: AgentStateMachine) -> AgentContext:
+            async with slots:
+                await machine.run()
+            return machine.context
+
+        return await asyncio.gather(*(run_machine(m) for m in machines))
@@ -1,5 +1,9 @@
+import asyncio
+import math
+from collections import deque
 from datetime import datetime, timezone
-from statistics import mean
+from typing import Awaitable, Callable, Final
+from agent.profiling import timed
 from models.agent import (
     AgentState,
     AgentContext,
@@ -7,16 +11,22 @@ from models.agent import (
     AgentConfig,
     HumanReviewDecision,
 )
-from models.validation import ValidationStatus, ValidationIssue, ValidationResult
+from models.validation import (
+    ValidationStatus,
+    ValidationIssueLevel,
+    ValidationIssue,
+    ValidationResult,
+)
 from models.planning import ResearchPlan
+from models.enums import tool_mask
 from models.research import (
     ToolName, 
     ToolResult,
-    ToolStatus,
     ResearchFinding,
     ResearchSection,
     ResearchReport, 
     ResearchDomain,
+    SUCCESS,
 )
 from models.mrd import (
     MRDMeta,
@@ -41,32 +51,201 @@ from tools.external_tools import (
     check_regulatory_compliance,
 )
 
-# State machine orchestrating the agent workflow from planning to MRD generation.
-class AgentStateMachine:
-    # Initialize the state machine with context and configuration.
-    def __init__(self, context: AgentContext, config: AgentConfig):
-        self.context = context
-        self.config = config
+# States in which the workflow stops running.
+_TERMINAL = frozenset({AgentState.COMPLETED, AgentState.FAILED})
+
+# Constants stamped onto every generated MRD.
+_AGENT_VERSION: Final[str] = "0.1.0"
+_TARGET_REGIONS: Final[tuple[str, ...]] = ("UK", "EU")
+_VERTICAL: Final[str] = "Real-money skill gaming"
+
+# Comma-separated sources of the tool results backing a finding.
+def _sources(report: ResearchReport, finding: ResearchFinding) -> str:
+    return ", ".join(tr.source for tr in report.supporting_data(finding))
+
+# Build an MRD synthesizer with the constant, deployment-wide parts prepared once.
+def _make_mrd_synthesizer() -> Callable[
+    [ResearchReport, ValidationResult, str], MarketRequirementsDocument
+]:
+    succeeding_players = ("Triumph",)
+    struggling_players = ("Skillz",)
+    acquisition_channels = ("TikTok", "Influencer referrals")
+    competitor_strengths = ("Fast games", "Influencer growth")
+    competitor_weaknesses = ("Limited game modes",)
+    regulatory_constraints = ("Age verification", "AML checks")
+    feature_dependencies = ("Real-time matchmaking",)
+    weak_areas = ("Regulatory clarity",)
+    recommended_next_steps = ("Conduct legal review", "Pilot launch in UK")
+
+    # Fill the varying, findings-derived parts of the MRD around the prepared constants.
+    def synthesize(
+        report: ResearchReport, validation: ValidationResult, user_input: str
+    ) -> MarketRequirementsDocument:
+        section_map = report.section_map
 
-    # Execute the state machine loop until completion or failure.
-    def run(self):
-        while self.context.state not in {AgentState.COMPLETED, AgentState.FAILED}:
-            if self.context.state == AgentState.PLANNING:
-                self._handle_planning()
+        market_section = section_map[ResearchDomain.MARKET]
+        audience_section = section_map[ResearchDomain.AUDIENCE]
+        competition_section = section_map[ResearchDomain.COMPETITION]
+        regulation_section = section_map[ResearchDomain.REGULATION]
 
-            elif self.context.state == AgentState.RESEARCH:
-                self._handle_research()
+        market_trends = []
+        summary_parts = []
 
-            elif self.context.state == AgentState.VALIDATION:
-                self._handle_validation()
+        for finding in market_section.findings:
+            market_trends.append(
+                MarketTrend(
+                    trend=finding.finding,
+                    evidence=_sources(report, finding),
+                    confidence=finding.confidence,
+                )
+            )
+            summary_parts.append(finding.finding)
 
-            elif self.context.state == AgentState.HUMAN_REVIEW:
-                self._handle_human_review()
+        market_state = MarketState.model_construct(
+            summary=" ".join(summary_parts),
+            key_trends=market_trends,
+            succeeding_players=list(succeeding_players),
+            struggling_players=list(struggling_players),
+        )
 
-            elif self.context.state == AgentState.SYNTHESIS:
-                self._handle_synthesis()
+        audience_insights = [
+            AudienceInsight(
+                insight=finding.finding,
+                source=_sources(report, finding),
+                confidence=finding.confidence,
+            )
+            for finding in audience_section.findings
+        ]
 
-    # Transition to a new state and log the event.
+        target_audience = TargetAudience.model_construct(
+            age_range="18-30",
+            primary_gender="Male",
+            regions=list(_TARGET_REGIONS),
+            behavioral_insights=audience_insights,
+            acquisition_channels=list(acquisition_channels),
+        )
+
+        competitive_landscape = CompetitiveLandscape.model_construct(
+            competitors=[
+                Competitor(
+                    name="Triumph",
+                    category="Skill-based real-money gaming",
+                    strengths=list(competitor_strengths),
+                    weaknesses=list(competitor_weaknesses),
+                    data_source="Aggregated research findings",
+                )
+            ]
+        )
+
+        gaps = []
+        features = []
+
+        for finding in competition_section.findings:
+            gaps.append(
+                ProductGap(
+                    gap_description=finding.finding,
+                    evidence=_sources(report, finding),
+                    opportunity_rationale="Identified unmet opportunity",
+                )
+            )
+            features.append(
+                FeatureRecommendation(
+                    feature=finding.finding,
+                    priority="High",
+                    justification="Derived from validated gap analysis",
+                    dependencies=list(feature_dependencies),
+                )
+            )
+
+        gap_analysis = GapAnalysis.model_construct(
+            identified_gaps=gaps
+        )
+
+        regulatory_regions = [
+            RegulatoryRegion(
+                region="UK/EU",
+                legal_status="Conditionally permitted",
+                constraints=list(regulatory_constraints),
+                confidence=regulation_section.overall_confidence,
+            )
+        ]
+
+        regulatory_analysis = RegulatoryAnalysis.model_construct(
+            regions=regulatory_regions,
+            open_risks=[
+                f.finding for f in regulation_section.findings
+            ],
+        )
+
+        strategic_recommendations = StrategicRecommendations.model_construct(
+            features=features
+        )
+
+        confidence_summary = ConfidenceSummary(
+            overall_confidence=validation.overall_confidence,
+            weak_areas=list(weak_areas),
+            recommended_next_steps=list(recommended_next_steps),
+        )
+
+        meta = MRDMeta(
+            generated_at=datetime.now(timezone.utc),
+            agent_version=_AGENT_VERSION,
+            input_prompt=user_input,
+            target_regions=list(_TARGET_REGIONS),
+            vertical=_VERTICAL,
+        )
+
+        return MarketRequirementsDocument(
+            meta=meta,
+            market_state=market_state,
+            target_audience=target_audience,
+            competitive_landscape=competitive_landscape,
+            gap_analysis=gap_analysis,
+            regulatory_analysis=regulatory_analysis,
+            strategic_recommendations=strategic_recommendations,
+            confidence_summary=confidence_summary,
+        )
+
+    return synthesize
+
+# State machine orchestrating the agent workflow from planning to MRD generation.
+class AgentStateMachine:
+    # Initialize the state machine with context and configuration.
+    def __init__(self, context: AgentContext, config: AgentConfig):
+        self.context = context
+        self.context.events = deque(context.events, maxlen=config.max_event_history)
+        self.config = config
+        self._min_overall_confidence = config.default_min_overall_confidence
+        self._tool_semaphore = asyncio.Semaphore(config.max_parallel_tools)
+        self._dispatch: dict[AgentState, Callable[[], Awaitable[None]]] = {
+            AgentState.PLANNING: self._handle_planning,
+            AgentState.RESEARCH: self._handle_research,
+            AgentState.VALIDATION: self._handle_validation,
+            AgentState.HUMAN_REVIEW: self._handle_human_review,
+            AgentState.SYNTHESIS: self._handle_synthesis,
+        }
+        self._transitions: asyncio.Queue[AgentState] = asyncio.Queue()
+        self._refresh_tools = False
+        self._synthesize = _make_mrd_synthesizer()
+
+    # Execute the state machine by reacting to queued transitions until completion or failure.
+    async def run(self):
+        self._transitions.put_nowait(self.context.state)
+
+        while (state := await self._transitions.get()) not in _TERMINAL:
+            handler = self._dispatch.get(state)
+
+            if handler is None:
+                break
+
+            with timed(
+                state.name,
+                self.context.phase_timings,
+                self.context.phase_cpu_timings,
+            ):
+                await handler()
+
+    # Transition to a new state, log the event, and queue the state for the run loop.
     def _transition(self, new_state: AgentState, message: str):
         self.context.events.append(
             AgentEvent(
@@ -77,43 +256,45 @@ class AgentStateMachine:
             )
         )
         self.context.state = new_state
+        self._transitions.put_nowait(new_state)
 
     # Handle the planning state by creating a research plan.
-    def _handle_planning(self):
+    async def _handle_planning(self):
         plan = self._create_research_plan()
         self.context.research_plan = plan
         self._transition(AgentState.RESEARCH, "Research plan created")
 
     # Handle the research state by executing research and checking retry limits.
-    def _handle_research(self):
+    async def _handle_research(self):
         if self.context.research_retry_count >= self.config.max_research_retries:
             self._transition(AgentState.FAILED, "Exceeded maximum research retries")
             return
 
-        report = self._run_research()
+        report = await self._run_research()
         self.context.research_report = report
         self.context.research_retry_count += 1
         self._transition(AgentState.VALIDATION, "Research completed")
 
     # Handle the validation state by checking research quality and completeness.
-    def _handle_validation(self):
+    async def _handle_validation(self):
         result = self._validate_research()
         self.context.validation_result = result
 
-        if result.status == ValidationStatus.PASS:
+        if result.status is ValidationStatus.PASS:
             self._transition(AgentState.SYNTHESIS, "Validation passed")
 
-        elif result.status == ValidationStatus.RETRY:
+        elif result.status is ValidationStatus.RETRY:
+            self._refresh_tools = True
             self._transition(AgentState.RESEARCH, "Validation requested retry")
 
-        elif result.status == ValidationStatus.HUMAN_REVIEW:
+        elif result.status is ValidationStatus.HUMAN_REVIEW:
             self._transition(AgentState.HUMAN_REVIEW, "Validation requires human review")
 
         else:
             self._transition(AgentState.FAILED, "Validation failed")
 
     # Handle the human review state by getting approval or rejection.
-    def _handle_human_review(self):
+    async def _handle_human_review(self):
         decision = self._get_human_decision()
         self.context.human_review = decision
 
@@ -124,7 +305,7 @@ class AgentStateMachine:
             self._transition(AgentState.FAILED, "Human review rejected")
 
     # Handle the synthesis state by generating the final MRD.
-    def _handle_synthesis(self):
+    async def _handle_synthesis(self):
         mrd = self._synthesize_mrd()
         self.context.final_mrd = mrd
         self._transition(AgentState.COMPLETED, "MRD synthesis completed")
@@ -135,7 +316,7 @@ class AgentStateMachine:
             objective=self.context.user_input,
             primary_app="Triumph",
             comparison_apps=["Skillz"],
-            regions=["UK", "EU"],
+            regions=list(_TARGET_REGIONS),
             research_domains=[
                 ResearchDomain.MARKET,
                 ResearchDomain.AUDIENCE,
@@ -157,8 +338,16 @@ class AgentStateMachine:
             created_by="agent",
         )
 
+    # Call an external tool, bounded by the configured tool concurrency.
+    # Cached responses are reused within the TTL, except after a retry, which refetches them.
+    async def _call_tool(self, tool, *args):
+        max_age = 0.0 if self._refresh_tools else self.config.tool_cache_ttl_seconds
+
+        async with self._tool_semaphore:
+            return await tool(*args, max_age=max_age)
+
     # Execute research by calling tools and gathering findings across domains.
-    def _run_research(self) -> ResearchReport:
+    async def _run_research(self) -> ResearchReport:
         plan = self.context.research_plan
 
         if plan is None:
@@ -166,91 +355,71 @@ class AgentStateMachine:
 
         sections = []
 
-        tool_results = []
-
-        market_data = search_sensor_tower(plan.primary_app)
-        tool_results.append(
-            ToolResult(
-                tool_name=ToolName.SENSOR_TOWER,
-                status=ToolStatus.SUCCESS,
-                data=market_data,
-                error_message=None,
-                source="Sensor Tower (mocked)",
-                collected_at=datetime.now(timezone.utc),
-            )
+        tool_calls = (
+            (ToolName.SENSOR_TOWER, search_sensor_tower, plan.primary_app, "Sensor Tower (mocked)"),
+            (ToolName.SENTIMENT_ANALYSIS, analyze_sentiment, "TikTok", "TikTok sentiment (mocked)"),
+            (ToolName.REGULATORY_CHECK, check_regulatory_compliance, "UK/EU", "Regulatory DB (mocked)"),
         )
 
-        sentiment_data = analyze_sentiment("TikTok")
-        tool_results.append(
-            ToolResult(
-                tool_name=ToolName.SENTIMENT_ANALYSIS,
-                status=ToolStatus.SUCCESS,
-                data=sentiment_data,
-                error_message=None,
-                source="TikTok sentiment (mocked)",
-                collected_at=datetime.now(timezone.utc),
-            )
+        payloads = await asyncio.gather(
+            *(self._call_tool(tool, argument) for _, tool, argument, _ in tool_calls)
         )
+        now = datetime.now(timezone.utc)
 
-        regulatory_data = check_regulatory_compliance("UK/EU")
-        tool_results.append(
-            ToolResult(
-                tool_name=ToolName.REGULATORY_CHECK,
-                status=ToolStatus.SUCCESS,
-                data=regulatory_data,
-                error_message=None,
-                source="Regulatory DB (mocked)",
-                collected_at=datetime.now(timezone.utc),
-            )
-        )
+        tool_results = []
+        tool_index = {}
+
+        for (tool_name, _, _, source), payload in zip(tool_calls, payloads):
+            tool_index[tool_name] = len(tool_results)
+            tool_results.append(ToolResult.make(tool_name, SUCCESS, payload, source, now))
 
-        market_section = ResearchSection(
+        market_section = ResearchSection.model_construct(
             domain=ResearchDomain.MARKET,
             findings=[
-                ResearchFinding(
+                ResearchFinding.model_construct(
                     finding="Influencer-driven acquisition is outperforming paid channels",
-                    related_tools=[ToolName.SENSOR_TOWER],
+                    related_tools_mask=tool_mask(ToolName.SENSOR_TOWER),
                     confidence=0.8,
-                    supporting_data=[tool_results[0]],
+                    supporting_data_ids=[tool_index[ToolName.SENSOR_TOWER]],
                 )
             ],
             overall_confidence=0.7,
         )
 
-        audience_section = ResearchSection(
+        audience_section = ResearchSection.model_construct(
             domain=ResearchDomain.AUDIENCE,
             findings=[
-                ResearchFinding(
+                ResearchFinding.model_construct(
                     finding="Young users engage more with short-session competitive games",
-                    related_tools=[ToolName.SENTIMENT_ANALYSIS],
+                    related_tools_mask=tool_mask(ToolName.SENTIMENT_ANALYSIS),
                     confidence=0.7,
-                    supporting_data=[tool_results[1]],
+                    supporting_data_ids=[tool_index[ToolName.SENTIMENT_ANALYSIS]],
                 )
             ],
             overall_confidence=0.7,
         )
 
-        competition_section = ResearchSection(
+        competition_section = ResearchSection.model_construct(
             domain=ResearchDomain.COMPETITION,
             findings=[
-                ResearchFinding(
+                ResearchFinding.model_construct(
                     finding="Competitors lack IO-style elimination game modes",
-                    related_tools=[ToolName.SENSOR_TOWER],
+                    related_tools_mask=tool_mask(ToolName.SENSOR_TOWER),
                     confidence=0.65,
-                    supporting_data=[tool_results[0]],
+                    supporting_data_ids=[tool_index[ToolName.SENSOR_TOWER]],
                 )
             ],
             overall_confidence=0.7,
         )
 
-        regulation_section = ResearchSection(
+        regulation_section = ResearchSection.model_construct(
             domain=ResearchDomain.REGULATION,
             findings=[
-                ResearchFinding(
+                ResearchFinding.model_construct(
                     finding="Skill-based gaming is conditionally permitted in UK/EU",
-                    related_tools=[ToolName.REGULATORY_CHECK],
+                    related_tools_mask=tool_mask(ToolName.REGULATORY_CHECK),
                     confidence=0.6,
-                    supporting_data=[tool_results[2]],
+                    supporting_data_ids=[tool_index[ToolName.REGULATORY_CHECK]],
                 )
             ],
             overall_confidence=0.65,
@@ -265,9 +434,10 @@ class AgentStateMachine:
             ]
         )
 
-        return ResearchReport(
+        return ResearchReport.model_construct(
             sections=sections,
-            generated_at=datetime.now(timezone.utc),
+            tool_pool=tool_results,
+            generated_at=now,
         )
 
     # Simulate human review decision based on validation confidence and issues.
@@ -277,14 +447,10 @@ class AgentStateMachine:
         if validation is None:
             raise RuntimeError("Human review requested without validation result")
 
-        has_critical_issues = any(
-            issue.level == "critical" for issue in validation.issues
-        )
-
         approved = (
             validation.overall_confidence
-            >= self.config.default_min_overall_confidence
-            and not has_critical_issues
+            >= self._min_overall_confidence
+            and not validation.has_critical_issues
         )
 
         return HumanReviewDecision(
@@ -301,86 +467,111 @@ class AgentStateMachine:
     # Validate research report for completeness, confidence, and data quality.
     def _validate_research(self) -> ValidationResult:
         issues = []
+        now = datetime.now(timezone.utc)
 
         report = self.context.research_report
         plan = self.context.research_plan
 
         if report is None or plan is None:
-            return ValidationResult(
+            return ValidationResult.model_construct(
                 status=ValidationStatus.FAIL,
                 issues=[
-                    ValidationIssue(
-                        level="critical",
+                    ValidationIssue.model_construct(
+                        level=ValidationIssueLevel.CRITICAL,
                         message="Missing research report or research plan",
                         related_section="system",
                     )
                 ],
                 overall_confidence=0.0,
-                validated_at=datetime.now(timezone.utc),
+                validated_at=now,
             )
 
-        section_map = {section.domain: section for section in report.sections}
+        section_map = report.section_map
+
+        missing_domains = frozenset(plan.research_domains) - section_map.keys()
 
-        for required_domain in plan.research_domains:
-            if required_domain not in section_map:
-                issues.append(
-                    ValidationIssue(
-                        level="error",
-                        message=f"Missing required research domain: {required_domain}",
-                        related_section=required_domain.value,
+        if missing_domains:
+            for required_domain in plan.research_domains:
+                if required_domain in missing_domains:
+                    issues.append(
+                        ValidationIssue.model_construct(
+                            level=ValidationIssueLevel.ERROR,
+                            message=f"Missing required research domain: {required_domain}",
+                            related_section=required_domain.value,
+                        )
                     )
-                )
 
-        if issues:
-            return ValidationResult(
+            return ValidationResult.model_construct(
                 status=ValidationStatus.RETRY,
                 issues=issues,
                 overall_confidence=0.0,
-                validated_at=datetime.now(timezone.utc),
+                validated_at=now,
             )
 
         section_confidences = []
         regulatory_confidence = None
+        has_critical_issues = False
+        scan_findings = True
 
         for domain, section in section_map.items():
             section_confidences.append(section.overall_confidence)
 
-            if domain == ResearchDomain.REGULATION:
+            if domain is ResearchDomain.REGULATION:
                 regulatory_confidence = section.overall_confidence
 
+            if not scan_findings:
+                continue
+
             for finding in section.findings:
-                if not finding.supporting_data:
+                if not finding.supporting_data_ids:
                     issues.append(
-                        ValidationIssue(
-                            level="error",
+                        ValidationIssue.model_construct(
+                            level=ValidationIssueLevel.CRITICAL,
                             message="Finding has no supporting tool data",
                             related_section=domain.value,
                         )
                     )
+                    has_critical_issues = True
+
+                    if self.config.validation_fail_fast:
+                        scan_findings = False
+                        break
+
+        overall_confidence = (
+            math.fsum(section_confidences) / len(section_confidences)
+            if section_confidences
+            else 0.0
+        )
 
-        overall_confidence = mean(section_confidences)
+        if has_critical_issues:
+            return ValidationResult.model_construct(
+                status=ValidationStatus.FAIL,
+                issues=issues,
+                overall_confidence=overall_confidence,
+                validated_at=now,
+            )
 
         if regulatory_confidence is not None and regulatory_confidence < 0.6:
-            return ValidationResult(
+            return ValidationResult.model_construct(
                 status=ValidationStatus.HUMAN_REVIEW,
                 issues=issues,
                 overall_confidence=overall_confidence,
-                validated_at=datetime.now(timezone.utc),
+                validated_at=now,
             )
 
         if overall_confidence < plan.minimum_overall_confidence:
-            return ValidationResult(
+            return ValidationResult.model_construct(
                 status=ValidationStatus.RETRY,
                 issues=issues,
                 overall_confidence=overall_confidence,
-                validated_at=datetime.now(timezone.utc),
+                validated_at=now,
             )
 
-        return ValidationResult(
+        return ValidationResult.model_construct(
             status=ValidationStatus.PASS,
             issues=issues,
             overall_confidence=overall_confidence,
-            validated_at=datetime.now(timezone.utc),
+            validated_at=now,
         )
 
     # Synthesize validated research into a complete market requirements document.
@@ -391,143 +582,5 @@ class AgentStateMachine:
         if report is None or validation is None:
             raise RuntimeError("Synthesis called without validated research")
 
-        section_map = {section.domain: section for section in report.sections}
-
-        market_section = section_map[ResearchDomain.MARKET]
-        audience_section = section_map[ResearchDomain.AUDIENCE]
-        competition_section = section_map[ResearchDomain.COMPETITION]
-        regulation_section = section_map[ResearchDomain.REGULATION]
-
-        market_trends = [
-            MarketTrend(
-                trend=finding.finding,
-                evidence=", ".join(
-                    tr.source for tr in finding.supporting_data
-                ),
-                confidence=finding.confidence,
-            )
-            for finding in market_section.findings
-        ]
-
-        market_state = MarketState(
-            summary=" ".join(f.finding for f in market_section.findings),
-            key_trends=market_trends,
-            succeeding_players=["Triumph"],
-            struggling_players=["Skillz"],
-        )
-
-        audience_insights = [
-            AudienceInsight(
-                insight=finding.finding,
-                source=", ".join(
-                    tr.source for tr in finding.supporting_data
-                ),
-                confidence=finding.confidence,
-            )
-            for finding in audience_section.findings
-        ]
-
-        target_audience = TargetAudience(
-            age_range="18-30",
-            primary_gender="Male",
-            regions=["UK", "EU"],
-            behavioral_insights=audience_insights,
-            acquisition_channels=["TikTok", "Influencer referrals"],
-        )
-
-        competitors = [
-            Competitor(
-                name="Triumph",
-                category="Skill-based real-money gaming",
-                strengths=["Fast games", "Influencer growth"],
-                weaknesses=["Limited game modes"],
-                data_source="Aggregated research findings",
-            )
-        ]
-
-        competitive_landscape = CompetitiveLandscape(
-            competitors=competitors
-        )
-
-        gaps = [
-            ProductGap(
-                gap_description=finding.finding,
-                evidence=", ".join(
-                    tr.source for tr in finding.supporting_data
-                ),
-                opportunity_rationale="Identified unmet opportunity",
-            )
-            for finding in competition_section.findings
-        ]
-
-        gap_analysis = GapAnalysis(
-            identified_gaps=gaps
-        )
-
-        regulatory_regions = [
-            RegulatoryRegion(
-                region="UK/EU",
-                legal_status="Conditionally permitted",
-                constraints=["Age verification", "AML checks"],
-                confidence=regulation_section.overall_confidence,
-            )
-        ]
-
-        regulatory_analysis = RegulatoryAnalysis(
-            regions=regulatory_regions,
-            open_risks=[
-                f.finding for f in regulation_section.findings
-            ],
-        )
-
-        features = [
-            FeatureRecommendation(
-                feature=gap.gap_description,
-                priority="High",
-                justification="Derived from validated gap analysis",
-                dependencies=["Real-time matchmaking"],
-            )
-            for gap in gaps
-        ]
-
-        strategic_recommendations = StrategicRecommendations(
-            features=features
-        )
-
-        confidence_summary = ConfidenceSummary(
-            overall_confidence=validation.overall_confidence,
-            weak_areas=["Regulatory clarity"],
-            recommended_next_steps=[
-                "Conduct legal review",
-                "Pilot launch in UK",
-            ],
-        )
-
-        meta = MRDMeta(
-            generated_at=datetime.now(timezone.utc),
-            agent_version="0.1.0",
-            input_prompt=self.context.user_input,
-            target_regions=["UK", "EU"],
-            vertical="Real-money skill gaming",
-        )
-
-        return MarketRequirementsDocument(
-            meta=meta,
-            market_state=market_state,
-            target_audience=target_audience,
-            competitive_landscape=competitive_landscape,
-            gap_analysis=gap_analysis,
-            regulatory_analysis=regulatory_analysis,
-            strategic_recommendations=strategic_recommendations,
-            confidence_summary=confidence_summary,
-        )
-
-
-
-
-
-
-
-
-
+        return self._synthesize(report, validation, self.context.user_input)
 
@@ -1,14 +1,15 @@
 from enum import Enum
+from dataclasses import dataclass
 from pydantic import BaseModel
 from datetime import datetime
-from typing import Optional, List
+from typing import Deque, Dict, Optional
 from models.planning import ResearchPlan
 from models.research import ResearchReport
 from models.validation import ValidationResult
 from models.mrd import MarketRequirementsDocument
 
 # Current state of the agent in its workflow lifecycle.
-class AgentState(str, Enum):
+class AgentState(Enum):
     PLANNING = "planning"
     RESEARCH = "research"
     VALIDATION = "validation"
@@ -25,15 +26,36 @@ class HumanReviewDecision(BaseModel):
     decided_at: datetime
 
 # Configuration settings for agent behavior and thresholds.
-class AgentConfig(BaseModel):
+@dataclass(slots=True, frozen=True)
+class AgentConfig:
     max_research_retries: int
     max_tool_retries: int
     default_min_section_confidence: float
     default_min_overall_confidence: float
+    max_parallel_tools: int = 3
+    validation_fail_fast: bool = True
+    max_event_history: int = 1024
+    tool_cache_ttl_seconds: float = 300.0
+
+    # Reject limits that would stall tool calls, discard every event, or break cache expiry.
+    def __post_init__(self):
+        if self.max_parallel_tools <= 0:
+            raise ValueError(
+                f"max_parallel_tools must be positive, got {self.max_parallel_tools}"
+            )
+        if self.max_event_history <= 0:
+            raise ValueError(
+                f"max_event_history must be positive, got {self.max_event_history}"
+            )
+        if self.tool_cache_ttl_seconds < 0:
+            raise ValueError(
+                f"tool_cache_ttl_seconds must not be negative, got {self.tool_cache_ttl_seconds}"
+            )
 
 
 # An event recording a state transition in the agent workflow.
-class AgentEvent(BaseModel):
+@dataclass(slots=True, frozen=True)
+class AgentEvent:
     state: AgentState
     message: str
     timestamp: datetime
@@ -51,4 +73,6 @@ class AgentContext(BaseModel):
     final_mrd: Optional[MarketRequirementsDocument]
     research_retry_count: int
     tool_retry_count: int
-    events: List[AgentEvent]
\ No newline at end of file
+    events: Deque[AgentEvent]
+    phase_timings: Dict[str, int] = {}
+    phase_cpu_timings: Dict[str, int] = {}
@@ -0,0 +1,59 @@
+from enum import StrEnum
+
+# Available external research tools for data gathering.
+class ToolName(StrEnum):
+    SENSOR_TOWER = "sensor_tower"
+    SENTIMENT_ANALYSIS = "sentiment_analysis"
+    REGULATORY_CHECK = "regulatory_check"
+
+# Bit assigned to each tool when a set of tools is packed into an int mask.
+# Bits are pinned so stored masks keep their meaning if ToolName members are reordered.
+_TOOL_BITS = {
+    ToolName.SENSOR_TOWER: 1 << 0,
+    ToolName.SENTIMENT_ANALYSIS: 1 << 1,
+    ToolName.REGULATORY_CHECK: 1 << 2,
+}
+
+# Largest mask value plus one, covering every combination of tools.
+TOOL_MASK_LIMIT = max(_TOOL_BITS.values()) << 1
+
+# Pack tools into a bitmask.
+def tool_mask(*tools: ToolName) -> int:
+    mask = 0
+    for tool in tools:
+        mask |= _TOOL_BITS[tool]
+    return mask
+
+# Return the mask with the tool's bit set.
+def add_tool(mask: int, tool: ToolName) -> int:
+    return mask | _TOOL_BITS[tool]
+
+# Whether the tool's bit is set in the mask.
+def has_tool(mask: int, tool: ToolName) -> bool:
+    return bool(mask & _TOOL_BITS[tool])
+
+# Status of a tool execution result.
+class ToolStatus(StrEnum):
+    SUCCESS = "success"
+    EMPTY = "empty"
+    FAILED = "failed"
+
+# Categories of research domains for market analysis.
+class ResearchDomain(StrEnum):
+    MARKET = "market"
+    AUDIENCE = "audience"
+    COMPETITION = "competition"
+    REGULATION = "regulation"
+
+# Outcome status of research validation.
+class ValidationStatus(StrEnum):
+    PASS = "pass"
+    RETRY = "retry"
+    HUMAN_REVIEW = "human_review"
+    FAIL = "fail"
+
+# Severity of a validation issue.
+class ValidationIssueLevel(StrEnum):
+    CRITICAL = "critical"
+    ERROR = "error"
+    WARNING = "warning"
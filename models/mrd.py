@@ -1,9 +1,11 @@
+from dataclasses import dataclass
 from typing import List, Optional
 from pydantic import BaseModel
 from datetime import datetime
 
 # Metadata for traceability, versioning, and audit purposes.
-class MRDMeta(BaseModel):
+@dataclass(slots=True, frozen=True)
+class MRDMeta:
     generated_at: datetime
     agent_version: str
     input_prompt: str
@@ -11,7 +13,8 @@ class MRDMeta(BaseModel):
     vertical: str
 
 # A market trend supported by evidence and a confidence score.
-class MarketTrend(BaseModel):
+@dataclass(slots=True, frozen=True)
+class MarketTrend:
     trend: str
     evidence: str
     confidence: float
@@ -24,7 +27,8 @@ class MarketState(BaseModel):
     struggling_players: List[str]
 
 # A behavioral or demographic insight about the target audience.
-class AudienceInsight(BaseModel):
+@dataclass(slots=True, frozen=True)
+class AudienceInsight:
     insight: str
     source: str
     confidence: float
@@ -38,7 +42,8 @@ class TargetAudience(BaseModel):
     acquisition_channels: List[str]
 
 # A competitor with their strengths and weaknesses.
-class Competitor(BaseModel):
+@dataclass(slots=True, frozen=True)
+class Competitor:
     name: str
     category: str
     strengths: List[str]
@@ -50,7 +55,8 @@ class CompetitiveLandscape(BaseModel):
     competitors: List[Competitor]
 
 # An unmet need in the market representing a potential opportunity.
-class ProductGap(BaseModel):
+@dataclass(slots=True, frozen=True)
+class ProductGap:
     gap_description: str
     evidence: str
     opportunity_rationale: str
@@ -60,7 +66,8 @@ class GapAnalysis(BaseModel):
     identified_gaps: List[ProductGap]
 
 # Legal status and regulatory constraints for a specific region.
-class RegulatoryRegion(BaseModel):
+@dataclass(slots=True, frozen=True)
+class RegulatoryRegion:
     region: str
     legal_status: str
     constraints: List[str]
@@ -72,7 +79,8 @@ class RegulatoryAnalysis(BaseModel):
     open_risks: List[str]
 
 # A recommended product feature with priority and justification.
-class FeatureRecommendation(BaseModel):
+@dataclass(slots=True, frozen=True)
+class FeatureRecommendation:
     feature: str
     priority: str
     justification: str
@@ -83,7 +91,8 @@ class StrategicRecommendations(BaseModel):
     features: List[FeatureRecommendation]
 
 # Overall confidence assessment and areas needing further research.
-class ConfidenceSummary(BaseModel):
+@dataclass(slots=True, frozen=True)
+class ConfidenceSummary:
     overall_confidence: float
     weak_areas: List[str]
     recommended_next_steps: List[str]
@@ -16,4 +16,4 @@ class ResearchPlan(BaseModel):
     minimum_overall_confidence: float
     assumptions: List[str]
     created_at: datetime
-    created_by: str
+    created_by: str
\ No newline at end of file
@@ -1,55 +1,163 @@
-from enum import Enum
-from typing import Any, Optional
-from pydantic import BaseModel
+import sys
+from functools import cached_property
+from typing import Annotated, Final, Literal, Optional, Union
+from pydantic import BaseModel, ConfigDict, Field, field_validator, model_validator
 from datetime import datetime
+from models.enums import ToolName, ToolStatus, ResearchDomain, TOOL_MASK_LIMIT
 
-# Available external research tools for data gathering.
-class ToolName(str, Enum):
-    SENSOR_TOWER = "sensor_tower"
-    SENTIMENT_ANALYSIS = "sentiment_analysis"
-    REGULATORY_CHECK = "regulatory_check"
+# Confidence score between 0 and 1, validated as a native float.
+Confidence = Annotated[float, Field(ge=0.0, le=1.0, strict=True)]
 
-# Status of a tool execution result.
-class ToolStatus(str, Enum):
-    SUCCESS = "success"
-    EMPTY = "empty"
-    FAILED = "failed"
+# App download and growth figures returned by Sensor Tower.
+class SensorTowerData(BaseModel):
+    model_config = ConfigDict(frozen=True, extra="forbid")
+
+    tool_name: Literal[ToolName.SENSOR_TOWER] = ToolName.SENSOR_TOWER
+    downloads: int
+    growth_rate: str
+
+# Overall sentiment and recurring themes from a social media source.
+class SentimentData(BaseModel):
+    model_config = ConfigDict(frozen=True, extra="forbid")
+
+    tool_name: Literal[ToolName.SENTIMENT_ANALYSIS] = ToolName.SENTIMENT_ANALYSIS
+    sentiment: str
+    themes: tuple[str, ...]
+
+# Legal status and notes returned by a regulatory check.
+class RegulatoryData(BaseModel):
+    model_config = ConfigDict(frozen=True, extra="forbid")
+
+    tool_name: Literal[ToolName.REGULATORY_CHECK] = ToolName.REGULATORY_CHECK
+    status: str
+    notes: str
+
+# Payload of any research tool, dispatched on the tool that produced it.
+ToolPayload = Annotated[
+    Union[SensorTowerData, SentimentData, RegulatoryData],
+    Field(discriminator="tool_name"),
+]
 
 # Result from executing a research tool with data or error details.
 class ToolResult(BaseModel):
+    model_config = ConfigDict(frozen=True, extra="forbid")
+
     tool_name: ToolName
     status: ToolStatus
-    data: Optional[Any]
+    data: Optional[ToolPayload]
     error_message: Optional[str]
     source: str
     collected_at: datetime
 
+    # Intern source labels, which repeat across results, so equal sources share one string.
+    @field_validator("source")
+    @classmethod
+    def _intern_source(cls, source: str) -> str:
+        return sys.intern(source)
+
+    # Tag raw payload dicts with the result's tool so untagged tool responses still parse.
+    @model_validator(mode="before")
+    @classmethod
+    def _tag_payload(cls, values):
+        if isinstance(values, dict):
+            data = values.get("data")
+
+            if isinstance(data, dict) and "tool_name" not in data and "tool_name" in values:
+                values = {**values, "data": {**data, "tool_name": values["tool_name"]}}
+
+        return values
+
+    # Reject payloads produced by a different tool than the one this result is for.
+    @model_validator(mode="after")
+    def _check_payload_tool(self) -> "ToolResult":
+        if self.data is not None and self.data.tool_name != self.tool_name:
+            raise ValueError(
+                f"{self.tool_name} result carries {self.data.tool_name} data"
+            )
+
+        return self
+
+    # Build a result stamped with a timestamp shared by the rest of its batch.
+    @classmethod
+    def make(
+        cls,
+        tool_name: ToolName,
+        status: ToolStatus,
+        data: Optional[ToolPayload],
+        source: str,
+        now: datetime,
+        error_message: Optional[str] = None,
+    ) -> "ToolResult":
+        return cls(
+            tool_name=tool_name,
+            status=status,
+            data=data,
+            error_message=error_message,
+            source=source,
+            collected_at=now,
+        )
+
 # Tool result specific to market intelligence data for an app and region.
 class MarketIntelligenceResult(ToolResult):
+    model_config = ConfigDict(frozen=True, extra="forbid")
+
     app_name: str
     region: str
 
-# A single research finding with confidence and supporting evidence.
+# A single research finding with confidence, a related-tools bitmask, and supporting tool result indices.
 class ResearchFinding(BaseModel):
-    finding: str
-    related_tools: list[ToolName]
-    confidence: float
-    supporting_data: list[ToolResult]
+    model_config = ConfigDict(frozen=True, extra="forbid")
 
-# Categories of research domains for market analysis.
-class ResearchDomain(str, Enum):
-    MARKET = "market"
-    AUDIENCE = "audience"
-    COMPETITION = "competition"
-    REGULATION = "regulation"
+    finding: str
+    related_tools_mask: Annotated[int, Field(ge=0, lt=TOOL_MASK_LIMIT)]
+    confidence: Confidence
+    supporting_data_ids: list[int]
 
 # Research results grouped by domain with overall confidence.
 class ResearchSection(BaseModel):
+    model_config = ConfigDict(frozen=True, extra="forbid")
+
     domain: ResearchDomain
     findings: list[ResearchFinding]
-    overall_confidence: float
+    overall_confidence: Confidence
 
 # Complete research report containing all domain sections.
 class ResearchReport(BaseModel):
+    model_config = ConfigDict(frozen=True, extra="forbid")
+
     sections: list[ResearchSection]
-    generated_at: datetime
\ No newline at end of file
+    tool_pool: list[ToolResult]
+    generated_at: datetime
+
+    # Ensure every finding references a tool result that exists in the pool.
+    @model_validator(mode="after")
+    def _check_supporting_data_ids(self) -> "ResearchReport":
+        pool_size = len(self.tool_pool)
+
+        for section in self.sections:
+            for finding in section.findings:
+                for tool_index in finding.supporting_data_ids:
+                    if not 0 <= tool_index < pool_size:
+                        raise ValueError(
+                            f"Finding references missing tool result {tool_index}"
+                        )
+
+        return self
+
+    # Sections keyed by domain, built on first access and reused afterwards.
+    @cached_property
+    def section_map(self) -> dict[ResearchDomain, ResearchSection]:
+        return {section.domain: section for section in self.sections}
+
+    # Copy the report without carrying over a section_map built from the original sections.
+    def model_copy(self, *, update=None, deep=False) -> "ResearchReport":
+        copy = super().model_copy(update=update, deep=deep)
+        copy.__dict__.pop("section_map", None)
+        return copy
+
+    # Tool results backing a finding, resolved from the report's pool.
+    def supporting_data(self, finding: ResearchFinding) -> list[ToolResult]:
+        return [self.tool_pool[tool_index] for tool_index in finding.supporting_data_ids]
+
+# Module-level aliases for enum members tested on hot paths.
+SUCCESS: Final[ToolStatus] = ToolStatus.SUCCESS
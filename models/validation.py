@@ -1,24 +1,39 @@
-from enum import Enum
-from typing import List
-from pydantic import BaseModel
+from functools import cached_property
+from typing import Final, List
+from pydantic import BaseModel, ConfigDict
 from datetime import datetime
-
-# Outcome status of research validation.
-class ValidationStatus(str, Enum):
-    PASS = "pass"
-    RETRY = "retry"
-    HUMAN_REVIEW = "human_review"
-    FAIL = "fail"
+from models.enums import ValidationStatus, ValidationIssueLevel
+from models.research import Confidence
 
 # An issue identified during research validation.
 class ValidationIssue(BaseModel):
-    level: str
+    model_config = ConfigDict(frozen=True, extra="forbid")
+
+    level: ValidationIssueLevel
     message: str
     related_section: str
 
 # Result of validating research quality and completeness.
 class ValidationResult(BaseModel):
+    model_config = ConfigDict(frozen=True, extra="forbid")
+
     status: ValidationStatus
     issues: List[ValidationIssue]
-    overall_confidence: float
+    overall_confidence: Confidence
     validated_at: datetime
+
+    # Whether any issue is critical, computed on first access and reused afterwards.
+    @cached_property
+    def has_critical_issues(self) -> bool:
+        return any(
+            issue.level is CRITICAL for issue in self.issues
+        )
+
+    # Copy the result without carrying over a has_critical_issues computed from the original issues.
+    def model_copy(self, *, update=None, deep=False) -> "ValidationResult":
+        copy = super().model_copy(update=update, deep=deep)
+        copy.__dict__.pop("has_critical_issues", None)
+        return copy
+
+# Module-level alias for the issue level tested when scanning for critical issues.
+CRITICAL: Final[ValidationIssueLevel] = ValidationIssueLevel.CRITICAL
@@ -1,3 +1,6 @@
+import asyncio
+import sys
+from operator import attrgetter
 from models.agent import AgentContext, AgentState, AgentConfig
 from agent.state_machine import AgentStateMachine
 
@@ -23,7 +26,7 @@ def run_end_to_end_test():
     )
 
     agent = AgentStateMachine(context=context, config=config)
-    agent.run()
+    asyncio.run(agent.run())
 
     return context
 
@@ -35,11 +38,14 @@ if __name__ == "__main__":
     print(final_context.state)
 
     print("\n=== EVENT LOG ===")
-    for event in final_context.events:
-        print(f"[{event.timestamp}] {event.state}: {event.message}")
+    event_fields = attrgetter("timestamp", "state", "message")
+    sys.stdout.write(
+        "".join("[%s] %s: %s\n" % event_fields(event) for event in final_context.events)
+    )
 
     print("\n=== MRD OUTPUT (JSON) ===")
     if final_context.final_mrd:
-        print(final_context.final_mrd.model_dump())
+        sys.stdout.flush()
+        sys.stdout.buffer.write(final_context.final_mrd.model_dump_json().encode() + b"\n")
     else:
         print("No MRD produced")
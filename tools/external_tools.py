@@ -1,19 +1,66 @@
-def search_sensor_tower(app_name: str):
-    return {
-        "downloads": 120000,
-        "growth_rate": "12%",
-    }
+import math
+import time
+from collections import OrderedDict
+from functools import wraps
+from models.research import SensorTowerData, SentimentData, RegulatoryData
 
+_tool_caches = []
 
-def analyze_sentiment(social_source: str):
-    return {
-        "sentiment": "positive",
-        "themes": ["competition", "fast payouts"],
-    }
 
+# Cache a tool coroutine's results per argument tuple, evicting the least recently used entry.
+# Callers pass max_age (seconds) to refetch entries older than that; max_age=0 always refetches.
+def _async_lru_cache(maxsize: int):
+    def decorator(func):
+        cache = OrderedDict()
 
-def check_regulatory_compliance(region: str):
-    return {
-        "status": "conditionally_permitted",
-        "notes": "Skill-based classification required",
-    }
+        @wraps(func)
+        async def wrapper(*args, max_age: float = math.inf):
+            entry = cache.get(args)
+
+            if entry is not None and time.monotonic() - entry[0] < max_age:
+                cache.move_to_end(args)
+                return entry[1]
+
+            result = await func(*args)
+            cache[args] = (time.monotonic(), result)
+            cache.move_to_end(args)
+
+            if len(cache) > maxsize:
+                cache.popitem(last=False)
+
+            return result
+
+        _tool_caches.append(cache)
+        return wrapper
+
+    return decorator
+
+
+# Drop every cached tool response so the next calls fetch fresh data.
+def clear_tool_caches():
+    for cache in _tool_caches:
+        cache.clear()
+
+
+@_async_lru_cache(maxsize=256)
+async def search_sensor_tower(app_name: str) -> SensorTowerData:
+    return SensorTowerData(
+        downloads=120000,
+        growth_rate="12%",
+    )
+
+
+@_async_lru_cache(maxsize=256)
+async def analyze_sentiment(social_source: str) -> SentimentData:
+    return SentimentData(
+        sentiment="positive",
+        themes=("competition", "fast payouts"),
+    )
+
+
+@_async_lru_cache(maxsize=256)
+async def check_regulatory_compliance(region: str) -> RegulatoryData:
+    return RegulatoryData(
+        status="conditionally_permitted",
+        notes="Skill-based classification required",
+    )